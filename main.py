@@ -1,9 +1,26 @@
 """Main entry point for the Crunchbase scraper"""
 
 import os
-from typing import List
+import csv
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue
+from typing import Callable, List, Optional, Set, Tuple
 from dotenv import load_dotenv
+from selenium.common.exceptions import WebDriverException
+from src.models import CompanyData
 from src.scraper import CrunchbaseScraper
+from src.utils import normalize_company_name
+from src.fast_path import MAX_CONCURRENCY
+from src import cache
+
+logger = logging.getLogger(__name__)
+
+# Extra batch browsers reuse the main browser's saved session, so they don't need a window
+BATCH_HEADLESS = True
+PROGRESS_FILE = "companies_progress.csv"
+# Search names of the companies saved to PROGRESS_FILE, which holds their scraped names instead
+DONE_FILE = "companies_progress.done"
 
 def read_company_list(filename: str = "company_list.txt") -> List[str]:
     """Read company names from file"""
@@ -12,18 +29,165 @@ def read_company_list(filename: str = "company_list.txt") -> List[str]:
             print(f"Company list file '{filename}' not found.")
             return []
             
-        with open(filename, 'r', encoding='utf-8') as f:
-            # Read lines and strip whitespace
-            companies = [line.strip() for line in f if line.strip()]
+        with open(filename, 'rb') as f:
+            data = f.read()
+        # Strip each line once and drop blank ones
+        companies = [name for name in (line.decode('utf-8').strip() for line in data.splitlines()) if name]
         print(f"Loaded {len(companies)} companies from {filename}")
         return companies
     except Exception as e:
         print(f"Error reading company list: {e}")
         return []
 
+def read_done_names(filename: str = DONE_FILE) -> Set[str]:
+    """Read normalized search names of companies already saved to the progress file"""
+    # Deleting the progress file to start over forgets what was done too
+    if not os.path.exists(PROGRESS_FILE):
+        return set()
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return {normalize_company_name(line) for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+    except Exception as e:
+        logger.error("Error reading progress file: %s", e)
+        return set()
+
+def start_batch_scrapers(scraper: CrunchbaseScraper, count: int) -> List[CrunchbaseScraper]:
+    """Start extra logged-in scrapers alongside the main one, one browser per worker thread"""
+    scrapers = [scraper]
+    for i in range(count - 1):
+        logger.info("Starting browser %d/%d...", i + 2, count)
+        extra = CrunchbaseScraper(email=scraper.email, password=scraper.password, headless=BATCH_HEADLESS,
+                                  profile_dir=f"{CrunchbaseScraper.PROFILE_DIR}-{i + 2}")
+        if extra.access_homepage():
+            scrapers.append(extra)
+        else:
+            extra.close()
+    return scrapers
+
+def _retire_scraper(scraper: CrunchbaseScraper, workers: List[CrunchbaseScraper], idle: "Queue[Optional[CrunchbaseScraper]]"):
+    """Stop handing out a scraper whose browser couldn't be restarted"""
+    scraper.quit_driver()
+    workers.remove(scraper)
+    if not workers:
+        # Wake the tasks still waiting for a scraper so they give up instead of blocking forever
+        idle.put(None)
+
+def _scrape_with_free_scraper(idle: "Queue[Optional[CrunchbaseScraper]]", workers: List[CrunchbaseScraper],
+                              company_name: str, company_url: Optional[str]) -> Optional[CompanyData]:
+    """Scrape a company with whichever scraper is idle"""
+    scraper = idle.get()
+    if scraper is None:
+        idle.put(None)
+        logger.warning("Skipping '%s', no browsers left", company_name)
+        return None
+    try:
+        logger.debug("Processing company '%s'", company_name)
+        # Ambiguous matches are still put to the user, one worker at a time
+        return scraper.scrape_company(company_name, company_url=company_url)
+    except WebDriverException as e:
+        logger.warning("Browser failed while processing '%s': %s", company_name, e)
+        try:
+            restarted = scraper.restart_driver()
+        except Exception as e:
+            logger.error("Couldn't restart browser: %s", e)
+            restarted = False
+        if not restarted:
+            _retire_scraper(scraper, workers, idle)
+            scraper = None
+        return None
+    finally:
+        if scraper is not None:
+            idle.put(scraper)
+
+def process_batch(scraper: CrunchbaseScraper, company_list: List[str], companies: List[CompanyData]):
+    """
+    Scrape companies concurrently, writing each result as it completes and skipping ones already saved
+    Companies are fetched over HTTP first; only the rest are spread across browser workers
+    """
+    done = read_done_names()
+    remaining = []
+    for name in company_list:
+        if normalize_company_name(name) not in done:
+            remaining.append(name)
+        elif company_data := cache.get_company(name):
+            # Keep already-saved companies in the final export while they're cached
+            companies.append(company_data)
+    if len(remaining) < len(company_list):
+        logger.info("Skipping %d companies already in %s", len(company_list) - len(remaining), PROGRESS_FILE)
+    if not remaining:
+        return
+    
+    # A done list left behind by a deleted progress file is started over with it
+    done_file = open(DONE_FILE, 'a' if os.path.exists(PROGRESS_FILE) else 'w', encoding='utf-8')
+    scraper.open_csv_writer(PROGRESS_FILE, append=True)
+    
+    def save_progress(company_name: str, company_data: CompanyData):
+        """Save a company to the progress file and remember its search name as done"""
+        companies.append(company_data)
+        scraper.write_csv_row(company_data)
+        done_file.write(company_name + '\n')
+        done_file.flush()
+    
+    try:
+        # Fetch what we can without a browser first
+        logger.info("Fetching %d companies over HTTP...", len(remaining))
+        needs_browser = []
+        for name, (company_data, company_url) in zip(remaining, scraper.fetch_companies(remaining)):
+            if company_data:
+                save_progress(name, company_data)
+            else:
+                needs_browser.append((name, company_url))
+        if needs_browser:
+            scrape_in_browsers(scraper, needs_browser, save_progress)
+    finally:
+        done_file.close()
+
+def scrape_in_browsers(scraper: CrunchbaseScraper, company_list: List[Tuple[str, Optional[str]]],
+                       save_progress: Callable[[str, CompanyData], None]):
+    """
+    Spread companies across browser workers, saving each result as it completes
+    Companies come as (company_name, company_url) pairs, with the URL set when the HTTP pass already found it
+    """
+    total = len(company_list)
+    scrapers = start_batch_scrapers(scraper, min(MAX_CONCURRENCY, total))
+    logger.info("Processing %d companies in the browser with %d workers...", total, len(scrapers))
+    
+    idle = Queue()
+    for worker in scrapers:
+        idle.put(worker)
+    # Scrapers still in service, shrinking as browsers fail for good
+    workers = list(scrapers)
+    
+    executor = ThreadPoolExecutor(max_workers=len(scrapers))
+    try:
+        futures = {
+            executor.submit(_scrape_with_free_scraper, idle, workers, name, url): name for name, url in company_list
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            company_data = future.result()
+            logger.info("Finished %d/%d", i, total)
+            if company_data:
+                # Save progress after each company
+                save_progress(futures[future], company_data)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        for worker in scrapers[1:]:
+            worker.close()
+
 def main():
     # Load environment variables
     load_dotenv()
+    # Per-field scraping details are logged at DEBUG, set LOG_LEVEL=DEBUG to see them
+    # Only the scraper's own loggers follow LOG_LEVEL, so libraries like httpx don't log every request
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    log_level = logging.getLevelName((os.getenv('LOG_LEVEL') or 'INFO').upper())
+    if not isinstance(log_level, int):
+        logger.warning("Unknown LOG_LEVEL '%s', using INFO", os.getenv('LOG_LEVEL'))
+        log_level = logging.INFO
+    for name in ('src', __name__):
+        logging.getLogger(name).setLevel(log_level)
     email = os.getenv('CRUNCHBASE_EMAIL')
     password = os.getenv('CRUNCHBASE_PASSWORD')
     
@@ -60,40 +224,18 @@ def main():
                         break
                     
                     print(f"\nSearching for '{company_name}'...")
-                    if scraper.search_company(company_name):
-                        print("Successfully opened company page")
-                        
-                        # Scrape company data
-                        company_data = scraper.get_company_data()
-                        if company_data:
-                            companies.append(company_data)
-                        else:
-                            print("Failed to scrape company data")
-                    else:
-                        print("Failed to search/open company")
+                    try:
+                        company_data = scraper.scrape_company(company_name)
+                    except WebDriverException as e:
+                        print(f"Browser stopped working: {e}")
+                        break
+                    if company_data:
+                        companies.append(company_data)
             else:
                 # Batch processing mode
                 company_list = read_company_list()
                 if company_list:
-                    total = len(company_list)
-                    for i, company_name in enumerate(company_list, 1):
-                        print(f"\nProcessing company {i}/{total}: '{company_name}'")
-                        
-                        if scraper.search_company(company_name):
-                            print("Successfully opened company page")
-                            
-                            # Scrape company data
-                            company_data = scraper.get_company_data()
-                            if company_data:
-                                companies.append(company_data)
-                            else:
-                                print("Failed to scrape company data")
-                        else:
-                            print("Failed to search/open company")
-                        
-                        # Save progress after each company
-                        if companies:
-                            scraper.save_to_csv(companies, "companies_progress.csv")
+                    process_batch(scraper, company_list, companies)
                 else:
                     print("No companies to process. Please check company_list.txt")
         else:
@@ -1,66 +1,85 @@
 """Authentication-related functionality"""
 
 import time
-from typing import Optional, Callable
+import logging
+from typing import Optional, Callable, List, Tuple, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
-def find_and_fill_field(driver, selector: str, value: str, field_name: str, random_delay: Callable[[float, float], float]) -> bool:
-    """Find and fill a form field with human-like typing"""
-    try:
-        field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-        )
-        field.clear()
-        for char in value:
-            field.send_keys(char)
-            random_delay(0.1, 0.2)
-        return True
-    except TimeoutException:
-        print(f"Couldn't find {field_name} field")
-        return False
+logger = logging.getLogger(__name__)
+
+# Email field, password field and submit button, looked up together
+LOGIN_FORM_SELECTORS = ["input[type='email']", "input[type='password']", "button[type='submit']"]
+
+def find_login_form(driver) -> Union[List, bool]:
+    """Find all login form elements in one query, or False if any are missing"""
+    elements = driver.execute_script(
+        "return arguments[0].map(selector => document.querySelector(selector));",
+        LOGIN_FORM_SELECTORS
+    )
+    return elements if all(elements) else False
 
-def login(driver, email: str, password: str, random_delay: Callable[[float, float], float]) -> bool:
+def fill_fields(driver, fields: List[Tuple[object, str]]):
+    """Set the values of several form fields in one command, notifying the page's form bindings"""
+    driver.execute_script("""
+        for (const [field, value] of arguments[0]) {
+            field.focus();
+            field.value = value;
+            field.dispatchEvent(new Event('input', {bubbles: true}));
+            field.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    """, [[field, value] for field, value in fields])
+
+def type_like_human(field, value: str, random_delay: Callable[[float, float], float]):
+    """Type into a form field one character at a time"""
+    field.clear()
+    for char in value:
+        field.send_keys(char)
+        random_delay(0.1, 0.2)
+
+def login(driver, email: str, password: str, random_delay: Callable[[float, float], float], human_like: bool = False) -> bool:
     """Login to Crunchbase using credentials"""
     try:
         if not email or not password:
-            print("No credentials provided")
+            logger.warning("No credentials provided")
             return False
 
-        # Fill email field
-        if not find_and_fill_field(driver, "input[type='email']", email, "email", random_delay):
+        # Wait until the whole form has rendered, polling with one query
+        try:
+            email_field, password_field, login_button = WebDriverWait(driver, 10).until(find_login_form)
+        except TimeoutException:
+            logger.error("Couldn't find login form")
             return False
-        random_delay(0.5, 1)
 
-        # Fill password field
-        if not find_and_fill_field(driver, "input[type='password']", password, "password", random_delay):
-            return False
-        random_delay(0.5, 1)
+        if human_like:
+            type_like_human(email_field, email, random_delay)
+            random_delay(0.5, 1)
+            type_like_human(password_field, password, random_delay)
+            random_delay(0.5, 1)
+        else:
+            fill_fields(driver, [(email_field, email), (password_field, password)])
 
         # Click login button
-        try:
-            login_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-            )
-            login_button.click()
-            print("Login credentials submitted...")
-        except TimeoutException:
-            print("Couldn't find login button")
-            return False
+        login_url = driver.current_url
+        login_button.click()
+        logger.info("Login credentials submitted...")
 
         # Wait for redirect after login
-        random_delay(3, 5)
+        try:
+            WebDriverWait(driver, 10).until(EC.url_changes(login_url))
+        except TimeoutException:
+            pass
 
         # Verify login success
         if "/login" in driver.current_url:
-            print("Login seems to have failed. Please check your credentials.")
+            logger.error("Login seems to have failed. Please check your credentials.")
             return False
 
-        print("Successfully logged in!")
+        logger.info("Successfully logged in!")
         return True
 
     except Exception as e:
-        print(f"Error during login: {e}")
+        logger.error("Error during login: %s", e)
         return False 
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""On-disk cache of scraped company data"""
+
+from dataclasses import asdict
+from typing import Optional
+from diskcache import Cache
+
+from .models import CompanyData
+from . import utils
+
+CACHE_DIR = ".cache"
+CACHE_TTL_DAYS = 7
+
+# Opened lazily on first use, then shared by the batch worker threads
+_cache: Optional[Cache] = None
+
+def _get_cache() -> Cache:
+    """Open the cache on first use"""
+    global _cache
+    if _cache is None:
+        _cache = Cache(CACHE_DIR)
+    return _cache
+
+def get_company(company_name: str) -> Optional[CompanyData]:
+    """Get cached data for a company, or None if it's missing or older than the TTL"""
+    data = _get_cache().get(utils.normalize_company_name(company_name))
+    return CompanyData(**data) if data else None
+
+def set_company(company_name: str, company_data: CompanyData):
+    """Cache data for a company until the TTL expires"""
+    _get_cache().set(
+        utils.normalize_company_name(company_name),
+        asdict(company_data),
+        expire=CACHE_TTL_DAYS * 24 * 60 * 60
+    )
@@ -0,0 +1,304 @@
+"""HTTP fast path for pages that can be read without rendering them in a browser"""
+
+import asyncio
+import logging
+from typing import Optional, List, Tuple
+import httpx
+from selectolax.parser import HTMLParser, Node
+
+from .models import CompanyData
+from . import utils
+from . import selectors
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.crunchbase.com"
+AUTOCOMPLETE_URL = f"{BASE_URL}/v4/data/autocompletes"
+# Requests or browser sessions allowed at once in batch mode, to stay under the site's rate limits
+MAX_CONCURRENCY = 5
+
+# Where each labelled field's value lives inside its row
+LABEL_VALUE_SELECTORS = {
+    'Founded Date': "span[class*='field-type-date_precision']",
+    'Stock Symbol': "link-formatter a",
+    'Legal Name': "blob-formatter span",
+    'Operating Status': "span[class*='field-type-enum']"
+}
+
+def sync_cookies(client: httpx.Client, driver):
+    """Replace the client's cookies with the browser's current ones"""
+    client.cookies.clear()
+    for cookie in driver.get_cookies():
+        client.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+
+def build_client(driver) -> httpx.Client:
+    """Create an HTTP client that shares the logged-in browser session"""
+    headers = {
+        'User-Agent': driver.execute_script("return navigator.userAgent"),
+        'Accept-Language': 'en-US,en;q=0.9'
+    }
+    client = httpx.Client(http2=True, headers=headers, follow_redirects=True, timeout=15)
+    sync_cookies(client, driver)
+    return client
+
+def _autocomplete_params(company_name: str, limit: int) -> dict:
+    """Query parameters for an organization autocomplete search"""
+    return {
+        'query': company_name,
+        'collection_ids': 'organizations',
+        'limit': limit,
+        'source': 'topSearch'
+    }
+
+def _parse_autocomplete(data: dict) -> List[Tuple[str, str]]:
+    """Get (company_name, company_url) pairs from an autocomplete response"""
+    results = []
+    for entity in data.get('entities', []):
+        identifier = entity.get('identifier', {})
+        name = identifier.get('value')
+        permalink = identifier.get('permalink')
+        if name and permalink:
+            results.append((name, f"{BASE_URL}/organization/{permalink}"))
+    return results
+
+def search_companies(client: httpx.Client, company_name: str, limit: int = 5) -> Optional[List[Tuple[str, str]]]:
+    """
+    Search organizations through the autocomplete API
+    Returns: List of (company_name, company_url) pairs, or None if the request failed
+    """
+    try:
+        response = client.get(AUTOCOMPLETE_URL, params=_autocomplete_params(company_name, limit))
+        response.raise_for_status()
+        return _parse_autocomplete(response.json())
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning("Autocomplete search failed: %s", e)
+        return None
+
+def _text(node: Node) -> str:
+    """Get the visible text of a node with whitespace collapsed"""
+    return ' '.join(node.text(deep=True).split())
+
+def get_clean_company_name(tree: HTMLParser) -> Optional[str]:
+    """Get company name from the heading's own text nodes, without extra elements"""
+    heading = tree.css_first("h1.profile-name")
+    if heading is None:
+        return None
+    name = ''.join(child.text(deep=False) for child in heading.iter(include_text=True) if child.tag == '-text')
+    return name.strip() or None
+
+def get_company_description(tree: HTMLParser) -> Optional[str]:
+    """Get company description from the description-card element"""
+    for selector in selectors.FIELD_SELECTORS['about']:
+        description = tree.css_first(selector)
+        if description is not None:
+            return _text(description)
+    return None
+
+def get_row_by_svg(tree: HTMLParser, svg_path: str) -> Optional[Node]:
+    """Get the li element whose icon matches the SVG path"""
+    current = tree.css_first(f'path[d^="{svg_path[:30]}"]')  # Match first 30 chars
+    iterations = 0
+    while current is not None and iterations < 10:
+        if current.tag == 'li':
+            return current
+        current = current.parent
+        iterations += 1
+    return None
+
+def get_field_by_svg(row: Node) -> Optional[str]:
+    """Get the first non-empty span text in a field row"""
+    for span in row.css("span"):
+        text = _text(span)
+        if text and not text.startswith('svg'):
+            return text
+    return None
+
+def get_numeric_field_by_label(tree: HTMLParser, label_text: str) -> Optional[int]:
+    """Get numeric value from the link labelled with the label text"""
+    for link in tree.css("a"):
+        if not any(span.text(deep=False).strip() == label_text for span in link.css("span")):
+            continue
+        element = link.css_first("span[class*='field-type-integer']")
+        if element is not None:
+            value = element.attributes.get('title') or _text(element)
+            if value and value.isdigit():
+                return int(value)
+    return None
+
+def get_field_by_label(tree: HTMLParser, label_text: str) -> Optional[str]:
+    """Get field value from the row labelled with the label text"""
+    words = label_text.split()
+    first_word, last_word = words[0], words[-1]
+
+    for row in tree.css("li"):
+        span_texts = [span.text(deep=False) for span in row.css("span")]
+        if not (any(first_word in t for t in span_texts) and any(last_word in t for t in span_texts)):
+            continue
+        element = row.css_first(LABEL_VALUE_SELECTORS.get(label_text, "[class*='field-formatter']"))
+        if element is not None:
+            # For stock symbol, the title attribute contains just the symbol
+            if label_text == 'Stock Symbol':
+                return element.attributes.get('title')
+            return element.attributes.get('title') or _text(element)
+    return None
+
+def get_funding_info(tree: HTMLParser) -> Optional[str]:
+    """Get complete funding information text"""
+    for block in tree.css("markup-block"):
+        text = _text(block)
+        if 'has raised' in text or 'total of' in text:
+            return text
+    return None
+
+def get_funding_amount(tree: HTMLParser) -> Optional[str]:
+    """Get the total funding amount string, or the first amount on the page when it isn't labelled"""
+    for span in tree.css("span"):
+        if 'Total Funding Amount' not in span.text(deep=False):
+            continue
+        current = span.parent
+        while current is not None:
+            if current.tag == 'div' and 'info' in (current.attributes.get('class') or ''):
+                element = current.css_first("span[class*='field-type-money']")
+                if element is not None:
+                    return element.attributes.get('title') or _text(element)
+                break
+            current = current.parent
+
+    for element in tree.css("span[class*='field-type-money']"):
+        text = element.text(deep=False)
+        if '$' in text or '¥' in text:
+            return element.attributes.get('title') or _text(element)
+    return None
+
+def parse_company_page(html: str) -> Tuple[Optional[CompanyData], Optional[str]]:
+    """
+    Parse company data from a server-rendered company page
+    Returns: Tuple of (company_data, funding_text), with no company data if the page needs a browser.
+    The funding amount is left for the caller to convert, since that may fetch exchange rates
+    """
+    tree = HTMLParser(html)
+
+    name = get_clean_company_name(tree)
+    if not name:
+        return None, None
+
+    company_data = CompanyData(name=name)
+    company_data.about = get_company_description(tree)
+
+    for field, svg_path in utils.SVG_FIELDS.items():
+        row = get_row_by_svg(tree, svg_path)
+        if row is None:
+            continue
+        value = get_field_by_svg(row)
+        if value:
+            if field == 'website':
+                # For website, we need the actual href
+                link = row.css_first("a")
+                if link is not None and link.attributes.get('href'):
+                    value = link.attributes['href']
+            elif field == 'ranking' and value.isdigit():
+                value = int(value)
+            setattr(company_data, field, value)
+
+    for field, label in utils.NUMERIC_FIELDS.items():
+        setattr(company_data, field, get_numeric_field_by_label(tree, label))
+
+    for field, label in utils.LABEL_FIELDS.items():
+        value = get_field_by_label(tree, label)
+        if not value:
+            continue
+        if field == 'founded_date':
+            try:
+                # Extract year from the date string
+                company_data.year_founded = int(value.split(',')[-1].strip())
+            except ValueError:
+                logger.warning("Couldn't parse founded date: %s", value)
+        else:
+            setattr(company_data, field, value)
+
+    return company_data, get_funding_amount(tree)
+
+def fetch_company_data(client: httpx.Client, company_url: str) -> Optional[CompanyData]:
+    """Fetch and parse a company page over HTTP, or None if the browser is needed"""
+    try:
+        response = client.get(company_url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning("Error fetching company page: %s", e)
+        return None
+
+    company_data, funding_text = parse_company_page(response.text)
+    if company_data is None:
+        logger.debug("Company page requires a browser to render")
+        return None
+
+    utils.set_funding_amount(company_data, funding_text)
+    company_data.funding_info = fetch_funding_info(client, company_url)
+    logger.info("Company: %s (fetched without browser)", company_data.name)
+    return company_data
+
+def fetch_funding_info(client: httpx.Client, company_url: str) -> Optional[str]:
+    """Fetch funding information from a company's financials tab over HTTP, or None if it wasn't found"""
+    try:
+        response = client.get(f"{company_url}/company_financials")
+        response.raise_for_status()
+        return get_funding_info(HTMLParser(response.text))
+    except httpx.HTTPError as e:
+        logger.warning("Error fetching financials page: %s", e)
+        return None
+
+async def _fetch_company_async(client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                               company_name: str) -> Tuple[Optional[CompanyData], Optional[str], Optional[str]]:
+    """
+    Search for and fetch a single company
+    Returns: Tuple of (company_data, company_url, funding_text), with no company data if it needs
+    the browser and no URL if the search didn't settle on one
+    """
+    url = None
+    async with semaphore:
+        try:
+            response = await client.get(AUTOCOMPLETE_URL, params=_autocomplete_params(company_name, 5))
+            response.raise_for_status()
+            name, url = utils.pick_best_match(company_name, _parse_autocomplete(response.json()), interactive=False)
+            if not url:
+                return None, None, None
+
+            response = await client.get(url)
+            response.raise_for_status()
+            company_data, funding_text = parse_company_page(response.text)
+            if company_data is None:
+                return None, url, None
+
+            response = await client.get(f"{url}/company_financials")
+            if response.is_success:
+                company_data.funding_info = get_funding_info(HTMLParser(response.text))
+
+            logger.info("Company: %s (fetched without browser)", company_data.name)
+            return company_data, url, funding_text
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Error fetching '%s': %s", company_name, e)
+            return None, url, None
+
+async def _fetch_many_async(client: httpx.Client,
+                            company_names: List[str]) -> List[Tuple[Optional[CompanyData], Optional[str], Optional[str]]]:
+    """Fetch companies concurrently, at most MAX_CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers=client.headers, cookies=client.cookies,
+                                 follow_redirects=True, timeout=15) as async_client:
+        return await asyncio.gather(*(
+            _fetch_company_async(async_client, semaphore, name) for name in company_names
+        ))
+
+def fetch_many(client: httpx.Client, company_names: List[str]) -> List[Tuple[Optional[CompanyData], Optional[str]]]:
+    """
+    Fetch many companies concurrently over HTTP, sharing the client's session
+    Returns: (company_data, company_url) pairs in the same order as the names, with no company data
+    where the browser is needed and no URL where the search has to be repeated in the browser
+    """
+    results = []
+    for company_data, company_url, funding_text in asyncio.run(_fetch_many_async(client, company_names)):
+        # Exchange rates are looked up with blocking requests, so convert after the event loop is done
+        if company_data:
+            utils.set_funding_amount(company_data, funding_text)
+        results.append((company_data, company_url))
+    return results
@@ -1,9 +1,10 @@
 """Data models for the scraper"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Optional, List
 
-@dataclass
+@dataclass(slots=True)
 class CompanyData:
     name: str
     about: Optional[str] = None
@@ -31,19 +32,18 @@ class CompanyData:
 
     def to_dict(self) -> dict:
         """Convert to dictionary, excluding None values"""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        return {k: v for k in _FIELDS if (v := getattr(self, k)) is not None}
 
     def to_csv_row(self) -> List[str]:
         """Convert to CSV row with all fields"""
-        return [
-            str(getattr(self, field.name, ''))
-            for field in self.__class__.__dataclass_fields__.values()
-        ]
+        return ['' if value is None else str(value) for value in _GETTER(self)]
 
     @staticmethod
     def get_csv_headers() -> List[str]:
         """Get CSV headers based on field names"""
-        return [
-            field.name.replace('_', ' ').title()
-            for field in CompanyData.__dataclass_fields__.values()
-        ] 
\ No newline at end of file
+        return list(_HEADERS)
+
+# Field names are fixed at class creation, so resolve them once
+_FIELDS = tuple(field.name for field in fields(CompanyData))
+_GETTER = attrgetter(*_FIELDS)
+_HEADERS = tuple(name.replace('_', ' ').title() for name in _FIELDS) 
\ No newline at end of file
@@ -1,7 +1,12 @@
 """Core scraper functionality"""
 
+import os
+import csv
+import json
 import time
-from typing import Optional, List
+import logging
+import threading
+from typing import Optional, List, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -16,15 +21,55 @@ from .models import CompanyData
 from . import auth
 from . import utils
 from . import selectors
+from . import fast_path
+from . import cache
+
+logger = logging.getLogger(__name__)
+
+# Path to the installed chromedriver, resolved once per process
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path() -> str:
+    """Install chromedriver on first use and reuse its path afterwards"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
 
 class CrunchbaseScraper:
     """Main scraper class"""
     
     BASE_URL = "https://www.crunchbase.com"
+    SESSION_FILE = ".crunchbase-session.json"
+    PROFILE_DIR = ".chrome-profile"
+    # Chrome leaks memory over long sessions, so relaunch it after this many companies
+    RECYCLE_EVERY = 50
+    # Analytics, ads and webfonts, none of which affect the scraped text
+    BLOCKED_URLS = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*facebook.net*",
+        "*hotjar.com*",
+        "*segment.io*",
+        "*hubspot.com*",
+        "*.woff2*",
+        "*.woff*",
+        "*.ttf*"
+    ]
     
-    def __init__(self, email: str, password: str, headless: bool = False):
+    def __init__(self, email: str, password: str, headless: bool = False, profile_dir: Optional[str] = None):
         self.headless = headless
+        # Chrome locks its profile, so concurrent scrapers each need their own
+        self.profile_dir = os.path.abspath(profile_dir or self.PROFILE_DIR)
         self.driver = None
+        self.client = None
+        self.company_url = None
+        self.csv_file = None
+        self.csv_writer = None
+        self.pages_served = 0
         self.email = email
         self.password = password
         self.setup_driver()
@@ -39,57 +84,247 @@ class CrunchbaseScraper:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Only text is scraped, so skip downloading images (webfonts are blocked in BLOCKED_URLS)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+        
         # Initialize the Chrome WebDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_driver_path())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.set_window_size(1920, 1080)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URLS})
+    
+    def save_session(self):
+        """Save the browser's cookies so later runs can skip logging in"""
+        try:
+            # Batch workers save concurrently, so each thread writes its own temp file
+            tmp_file = f"{self.SESSION_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f)
+            os.replace(tmp_file, self.SESSION_FILE)
+        except OSError as e:
+            logger.error("Error saving session: %s", e)
+    
+    def is_logged_in(self) -> bool:
+        """Open the homepage and check that we aren't sent to the login page"""
+        self.driver.get(f"{self.BASE_URL}/home")
+        self.wait_for_homepage()
+        return "/login" not in self.driver.current_url and self.driver.current_url.rstrip('/') != self.BASE_URL
+    
+    def restore_session(self) -> bool:
+        """Reuse the session kept in the browser profile, or cookies saved by a previous run"""
+        if self.is_logged_in():
+            return True
+        
+        try:
+            with open(self.SESSION_FILE, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.error("Error reading saved session: %s", e)
+            return False
+        
+        # Cookies can only be set for the domain currently loaded, which is_logged_in left us on
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                continue
+        
+        return self.is_logged_in()
+    
+    def wait_for_homepage(self, timeout: float = 10):
+        """Wait until the homepage's search box renders or we're sent back to the login page"""
+        search_box = ", ".join(selectors.SEARCH_BOX_SELECTORS)
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: "/login" in d.current_url or d.find_elements(By.CSS_SELECTOR, search_box)
+            )
+        except TimeoutException:
+            logger.warning("Homepage is taking a while to load")
     
     def access_homepage(self) -> bool:
         """Access the Crunchbase homepage and ensure we're logged in"""
         try:
-            print("Attempting automatic login...")
-            # Go to login page
-            login_url = f"{self.BASE_URL}/login"
-            self.driver.get(login_url)
-            utils.random_delay(2, 3)
-            
-            if not auth.login(self.driver, self.email, self.password, utils.random_delay):
-                print("\nAutomatic login failed.")
-                print("Please log in manually to your Crunchbase account.")
-                input("Press Enter once you've logged in and are ready to proceed...")
-            
-            # Try accessing the home page to verify login
-            self.driver.get(f"{self.BASE_URL}/home")
-            utils.random_delay(2, 3)
-            
-            # Check if we got redirected back (indicating login issues)
-            if self.driver.current_url == self.BASE_URL:
-                print("Warning: Unable to access homepage. Please verify you're logged in.")
-                input("Press Enter once you've verified login status...")
+            if self.restore_session():
+                logger.info("Restored saved session")
+                # Keep the saved cookies current for the batch browsers, which log in from them
+                self.save_session()
+            else:
+                logger.info("Attempting automatic login...")
+                # Go to login page
+                login_url = f"{self.BASE_URL}/login"
+                self.driver.get(login_url)
+                
+                if not auth.login(self.driver, self.email, self.password, utils.random_delay):
+                    logger.warning("Automatic login failed.")
+                    if self.headless:
+                        # There's no window to log in through manually
+                        return False
+                    print("Please log in manually to your Crunchbase account.")
+                    input("Press Enter once you've logged in and are ready to proceed...")
+                
+                # Try accessing the home page to verify login
+                self.driver.get(f"{self.BASE_URL}/home")
+                self.wait_for_homepage()
+                
+                # Check if we got redirected back (indicating login issues)
+                if self.driver.current_url == self.BASE_URL:
+                    print("Warning: Unable to access homepage. Please verify you're logged in.")
+                    if self.headless:
+                        return False
+                    input("Press Enter once you've verified login status...")
+                
+                self.save_session()
             
+            # Share the logged-in session with the HTTP fast path
+            self.client = fast_path.build_client(self.driver)
             return True
             
         except WebDriverException as e:
-            print(f"Error accessing site: {e}")
+            logger.error("Error accessing site: %s", e)
             return False
     
-    def search_company(self, company_name: str) -> bool:
-        """Search for a company and click the first result"""
-        return utils.search_and_click_first_result(self.driver, company_name, utils.random_delay)
+    def search_company(self, company_name: str, interactive: bool = True) -> bool:
+        """Search for a company and select the best match"""
+        self.company_url = None
+        if self.client:
+            results = fast_path.search_companies(self.client, company_name)
+            if results is None:
+                # The browser may have rotated its session cookies since they were copied
+                fast_path.sync_cookies(self.client, self.driver)
+                results = fast_path.search_companies(self.client, company_name)
+            if results is not None:
+                # No hits from the API means the search box would find nothing either
+                name, url = utils.pick_best_match(company_name, results, interactive)
+                self.company_url = url
+                return url is not None
+        
+        # Fall back to the search box when the autocomplete API is unavailable
+        return utils.search_and_click_first_result(self.driver, company_name, utils.random_delay, interactive)
     
     def get_company_data(self) -> Optional[CompanyData]:
-        """Scrape company data from the current page"""
-        return utils.scrape_company_data(self.driver, utils.random_delay)
+        """Scrape data for the selected company, only rendering the page in the browser when needed"""
+        if self.company_url:
+            company_data = fast_path.fetch_company_data(self.client, self.company_url)
+            if company_data:
+                return company_data
+            try:
+                self.driver.get(self.company_url)
+            except WebDriverException as e:
+                logger.error("Error opening company page: %s", e)
+                return None
+        return self.render_company_data()
+    
+    def render_company_data(self) -> Optional[CompanyData]:
+        """Scrape the company page open in the browser"""
+        # Only pages the browser rendered count towards recycling it
+        self.pages_served += 1
+        # Read the financials tab over HTTP where possible rather than loading it in the browser
+        fetch_funding_info = (lambda url: fast_path.fetch_funding_info(self.client, url)) if self.client else None
+        return utils.scrape_company_data(self.driver, fetch_funding_info)
+    
+    def scrape_company(self, company_name: str, interactive: bool = True, company_url: Optional[str] = None) -> Optional[CompanyData]:
+        """
+        Search for and scrape a company, reusing cached data while it's fresh
+        A company_url already found over HTTP, whose page needs the browser, skips the search and fetch attempts
+        """
+        company_data = cache.get_company(company_name)
+        if company_data:
+            logger.info("Using cached data for '%s'", company_name)
+            return company_data
+        
+        if self.pages_served >= self.RECYCLE_EVERY and not self.restart_driver():
+            # A logged-out browser would fail every company after this, so let the caller retire it
+            raise WebDriverException("Couldn't log back in after restarting the browser")
+        
+        if company_url:
+            self.company_url = company_url
+            self.driver.get(company_url)
+            company_data = self.render_company_data()
+        elif self.search_company(company_name, interactive):
+            company_data = self.get_company_data()
+        else:
+            logger.warning("Failed to search/open company")
+            return None
+        
+        if company_data:
+            cache.set_company(company_name, company_data)
+        else:
+            logger.warning("Failed to scrape company data")
+        return company_data
+    
+    def fetch_companies(self, company_names: List[str]) -> List[Tuple[Optional[CompanyData], Optional[str]]]:
+        """
+        Get many companies without the browser, from the cache or concurrent HTTP requests
+        Returns: (company_data, company_url) pairs in the same order as the names, with no company data
+        where the browser is needed and, for those, the company URL if the search already found it
+        """
+        results = [(cache.get_company(name), None) for name in company_names]
+        missing = [i for i, (company_data, _) in enumerate(results) if company_data is None]
+        if self.client and missing:
+            fetched = fast_path.fetch_many(self.client, [company_names[i] for i in missing])
+            for i, (company_data, company_url) in zip(missing, fetched):
+                if company_data:
+                    cache.set_company(company_names[i], company_data)
+                results[i] = (company_data, company_url)
+        return results
     
     def save_to_csv(self, companies: List[CompanyData], filename: str = "companies.csv"):
         """Save company data to CSV file"""
         utils.save_companies_to_csv(companies, filename)
     
+    def open_csv_writer(self, filename: str = "companies_progress.csv", append: bool = False):
+        """Start a CSV file that companies are appended to one row at a time, continuing it if append is set"""
+        self.close_csv_writer()
+        write_headers = not (append and os.path.exists(filename) and os.path.getsize(filename) > 0)
+        self.csv_file = open(filename, 'a' if append else 'w', buffering=1 << 16, newline='', encoding='utf-8')
+        self.csv_writer = csv.writer(self.csv_file)
+        if write_headers:
+            self.csv_writer.writerow(CompanyData.get_csv_headers())
+    
+    def write_csv_row(self, company: CompanyData):
+        """Append a company to the open CSV file"""
+        self.csv_writer.writerow(company.to_csv_row())
+        self.csv_file.flush()
+    
+    def close_csv_writer(self):
+        """Close the open CSV file, if any"""
+        if self.csv_file:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+    
+    def quit_driver(self):
+        """Quit the browser and the HTTP session borrowed from it"""
+        if self.client:
+            self.client.close()
+            self.client = None
+        if self.driver:
+            try:
+                self.driver.quit()
+            except WebDriverException as e:
+                logger.warning("Error quitting browser: %s", e)
+            self.driver = None
+    
+    def restart_driver(self) -> bool:
+        """Relaunch the browser and log back in, dropping leaked memory and dead sessions"""
+        logger.info("Restarting browser...")
+        self.quit_driver()
+        self.setup_driver()
+        self.pages_served = 0
+        return self.access_homepage()
+    
     def close(self):
         """Close the browser"""
-        if self.driver:
-            self.driver.quit() 
\ No newline at end of file
+        self.close_csv_writer()
+        self.quit_driver() 
\ No newline at end of file
@@ -8,4 +8,17 @@ SELECTORS = {
     'website': "#mat-tab-nav-panel-0 > div > full-profile > page-centered-layout.overview-divider.ng-star-inserted > div > row-card > div > div:nth-child(1) > profile-section > section-card > mat-card > div.section-content-wrapper > fields-card > ul > li:nth-child(5) > label-with-icon > span > field-formatter > link-formatter > a",
     'year_founded': "#mat-tab-nav-panel-0 > div > full-profile > page-centered-layout.content-cards > div > div > div.main-content > row-card:nth-child(2) > profile-section > section-card > mat-card > div.section-content-wrapper > fields-card:nth-child(1) > ul > li:nth-child(3) > field-formatter > span",
     'ranking': "#mat-tab-nav-panel-0 > div > full-profile > page-centered-layout.overview-divider.ng-star-inserted > div > row-card > div > div:nth-child(1) > profile-section > section-card > mat-card > div.section-content-wrapper > fields-card > ul > li:nth-child(6) > label-with-icon > span"
-} 
\ No newline at end of file
+}
+
+# Search box variants, in order of preference
+SEARCH_BOX_SELECTORS = [
+    "input[placeholder*='Search']",
+    "input[type='search']",
+    "input[aria-label*='search']",
+    "input[class*='search']"
+]
+
+# Fields read straight from the profile page in one pass; selectors are tried in order
+FIELD_SELECTORS = {
+    'about': ["description-card .description", ".description"]
+}
@@ -1,27 +1,41 @@
 """Utility functions for scraping"""
 
 import csv
+import logging
+import math
 import time
 import random
 import re
-from difflib import SequenceMatcher
-from typing import Optional, List, Callable, Tuple
+import threading
+from functools import lru_cache
+from typing import Optional, List, Callable, Tuple, Dict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from forex_python.converter import CurrencyRates
+from rapidfuzz import fuzz, process
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = pd = None
 
 from .models import CompanyData
 from . import selectors
 
+logger = logging.getLogger(__name__)
+
 # Constants
 CURRENCY_MULTIPLIERS = {
     'K': 1_000,
     'M': 1_000_000,
     'B': 1_000_000_000
 }
+# Number with optional thousands separators and multiplier suffix, e.g. "1,500.5M"
+_AMOUNT_RE = re.compile(r'([\d,.]+)\s*([KMBkmb])?')
 NAME_SIMILARITY_THRESHOLD = 0.8
 
 # Currency symbol to code mapping
@@ -37,6 +51,24 @@ CURRENCY_SYMBOLS = {
     'HK$': 'HKD',
     '₣': 'CHF',
 }
+# Longest symbols first so 'CN¥' wins over '¥'
+_CURRENCY_SYMBOL_PATTERN = '|'.join(re.escape(symbol) for symbol in sorted(CURRENCY_SYMBOLS, key=len, reverse=True))
+# Optional symbol, number and multiplier suffix matched in a single pass, e.g. "CN¥1,500.5M"
+_CURRENCY_AMOUNT_RE = re.compile(f'({_CURRENCY_SYMBOL_PATTERN})?\\s*{_AMOUNT_RE.pattern}')
+
+# Exchange rates are refetched after this many seconds
+RATE_TTL_SECONDS = 6 * 60 * 60
+# A failed rate lookup is retried after this many seconds, rather than once per amount
+RATE_RETRY_SECONDS = 10 * 60
+
+_currency_rates = CurrencyRates()
+# (source, target) -> (rate, fetched_at)
+_exchange_rates: Dict[Tuple[str, str], Tuple[float, float]] = {}
+# (source, target) -> (error, failed_at)
+_failed_rates: Dict[Tuple[str, str], Tuple[Exception, float]] = {}
+
+# Batch workers share the terminal, so only one asks the user to pick a match at a time
+_prompt_lock = threading.Lock()
 
 def random_delay(min_delay: float = 2.0, max_delay: float = 5.0) -> float:
     """Add random delay between actions and return the delay value"""
@@ -44,17 +76,48 @@ def random_delay(min_delay: float = 2.0, max_delay: float = 5.0) -> float:
     time.sleep(delay)
     return delay
 
-def detect_currency(amount_str: str) -> Tuple[str, str]:
-    """Detect currency from string and return (currency_code, cleaned_amount_str)"""
-    amount_str = amount_str.strip()
+def get_exchange_rate(source_currency: str, target_currency: str) -> float:
+    """
+    Get the exchange rate between two currencies, fetching it at most once per RATE_TTL_SECONDS
+    and retrying a failed lookup at most once per RATE_RETRY_SECONDS
+    """
+    now = time.monotonic()
+    key = (source_currency, target_currency)
+    cached = _exchange_rates.get(key)
+    if cached and now - cached[1] < RATE_TTL_SECONDS:
+        return cached[0]
+    
+    # The rates service has no request timeout, so don't call it again soon after it failed
+    failed = _failed_rates.get(key)
+    if failed and now - failed[1] < RATE_RETRY_SECONDS:
+        raise RuntimeError(f"{source_currency} to {target_currency} rate unavailable: {failed[0]}")
     
-    # Try to match currency symbols at the start of the string
-    for symbol, code in CURRENCY_SYMBOLS.items():
-        if amount_str.startswith(symbol):
-            return code, amount_str.replace(symbol, '', 1).strip()
+    try:
+        rate = _currency_rates.get_rate(source_currency, target_currency)
+    except Exception as e:
+        _failed_rates[key] = (e, now)
+        raise
+    _failed_rates.pop(key, None)
+    _exchange_rates[key] = (rate, now)
+    return rate
+
+@lru_cache(maxsize=4096)
+def parse_amount(amount_str: str) -> Optional[Tuple[str, float]]:
+    """Split an amount string into (currency_code, amount), or None if it isn't an amount"""
+    # Split the currency symbol, number and multiplier suffix in one pass
+    match = _CURRENCY_AMOUNT_RE.fullmatch(amount_str.strip())
+    if not match:
+        return None
     
     # Default to USD if no currency symbol found
-    return 'USD', amount_str
+    source_currency = CURRENCY_SYMBOLS[match.group(1)] if match.group(1) else 'USD'
+    
+    # Convert to float
+    multiplier = CURRENCY_MULTIPLIERS.get((match.group(3) or '').upper(), 1)
+    try:
+        return source_currency, float(match.group(2).replace(',', '')) * multiplier
+    except ValueError:
+        return None
 
 def parse_currency_amount(amount_str: str, target_currency: str = 'USD') -> Optional[float]:
     """
@@ -67,46 +130,34 @@ def parse_currency_amount(amount_str: str, target_currency: str = 'USD') -> Opti
     Returns:
         Float value in target currency or None if parsing fails
     """
-    try:
-        # Skip empty or invalid strings
-        if not amount_str or amount_str.lower() in ['n/a', 'unknown', '--']:
-            return None
-            
-        # Detect source currency and clean amount string
-        source_currency, cleaned_amount = detect_currency(amount_str)
-        
-        # Remove commas and other formatting
-        cleaned_amount = cleaned_amount.replace(',', '').strip()
-        
-        # Extract multiplier if present
-        multiplier = 1
-        for suffix, mult in CURRENCY_MULTIPLIERS.items():
-            if suffix in cleaned_amount:
-                multiplier = mult
-                cleaned_amount = cleaned_amount.replace(suffix, '').strip()
-                break
-        
-        # Convert to float
-        amount = float(cleaned_amount) * multiplier
-        
-        # Convert currency if needed
-        if source_currency != target_currency:
-            try:
-                c = CurrencyRates()
-                amount = c.convert(source_currency, target_currency, amount)
-            except Exception as e:
-                print(f"Currency conversion failed: {e}")
-                return None
-        
-        return amount
-        
-    except (ValueError, AttributeError) as e:
-        print(f"Could not convert amount '{amount_str}': {e}")
+    # Skip empty or invalid strings
+    if not amount_str or amount_str.lower() in ['n/a', 'unknown', '--']:
+        return None
+    
+    # Parsing is cached, while rates are applied fresh since they expire
+    parsed = parse_amount(amount_str)
+    if parsed is None:
+        logger.warning("Could not convert amount '%s'", amount_str)
         return None
+    source_currency, amount = parsed
+    
+    # Convert currency if needed
+    if source_currency != target_currency:
+        try:
+            amount = amount * get_exchange_rate(source_currency, target_currency)
+        except Exception as e:
+            logger.error("Currency conversion failed: %s", e)
+            return None
+    
+    return amount
+
+def normalize_company_name(name: str) -> str:
+    """Normalize a company name for use as a lookup key"""
+    return ' '.join(name.split()).casefold()
 
 def get_string_similarity(a: str, b: str) -> float:
     """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    return fuzz.ratio(a.lower(), b.lower()) / 100.0
 
 def get_search_results(driver) -> List[Tuple[str, str]]:
     """Get list of company names and their URLs from search results"""
@@ -136,72 +187,79 @@ def get_search_results(driver) -> List[Tuple[str, str]]:
         
         return company_results
     except Exception as e:
-        print(f"Error getting search results: {e}")
+        logger.error("Error getting search results: %s", e)
         return []
 
-def analyze_search_results(driver, search_name: str) -> Tuple[Optional[str], Optional[str]]:
+def pick_best_match(search_name: str, results: List[Tuple[str, str]], interactive: bool = True) -> Tuple[Optional[str], Optional[str]]:
     """
-    Analyze search results and return best match (if any)
+    Pick the best match for a search from a list of (company_name, company_url) results
+    When not interactive, ambiguous results are skipped instead of prompting the user
     Returns: Tuple of (company_name, company_url) or (None, None) if no match
     """
-    results = get_search_results(driver)
-    
     if not results:
-        print(f"No results found for '{search_name}'")
+        logger.info("No results found for '%s'", search_name)
         return None, None
     
-    # Check for exact or similar matches
+    # An exact case-insensitive match needs no scoring
+    folded_name = search_name.casefold()
+    for name, url in results:
+        if name.casefold() == folded_name:
+            logger.info("Found exact match: '%s'", name)
+            return name, url
+    
+    # Score all candidates in one native call
     best_match = None
     best_similarity = 0
     
-    for name, url in results:
-        similarity = get_string_similarity(search_name, name)
-        if similarity > best_similarity:
-            best_similarity = similarity
-            best_match = (name, url)
+    match = process.extractOne(search_name, [name for name, _ in results], scorer=fuzz.ratio, processor=str.lower)
+    if match:
+        _, score, index = match
+        best_similarity = score / 100.0
+        best_match = results[index]
     
     if best_match:
         name, url = best_match
         if best_similarity >= NAME_SIMILARITY_THRESHOLD:
-            print(f"Found match: '{name}' (similarity: {best_similarity:.2f})")
+            logger.info("Found match: '%s' (similarity: %.2f)", name, best_similarity)
             return name, url
+        elif not interactive:
+            logger.info("No close match for '%s' (best: '%s', similarity: %.2f)", search_name, name, best_similarity)
+            return None, None
         else:
-            # Show options to user
-            print(f"\nMultiple potential matches found for '{search_name}':")
-            for i, (name, url) in enumerate(results, 1):
-                similarity = get_string_similarity(search_name, name)
-                print(f"{i}. {name} (similarity: {similarity:.2f})")
-            
-            while True:
-                choice = input("\nEnter number to select company (or 's' to skip): ").strip().lower()
-                if choice == 's':
-                    return None, None
-                try:
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(results):
-                        return results[idx]
-                except ValueError:
-                    pass
-                print("Invalid choice. Please try again.")
+            with _prompt_lock:
+                # Show options to user
+                print(f"\nMultiple potential matches found for '{search_name}':")
+                for i, (name, url) in enumerate(results, 1):
+                    similarity = get_string_similarity(search_name, name)
+                    print(f"{i}. {name} (similarity: {similarity:.2f})")
+                
+                while True:
+                    choice = input("\nEnter number to select company (or 's' to skip): ").strip().lower()
+                    if choice == 's':
+                        return None, None
+                    try:
+                        idx = int(choice) - 1
+                        if 0 <= idx < len(results):
+                            return results[idx]
+                    except ValueError:
+                        pass
+                    print("Invalid choice. Please try again.")
     
     return None, None
 
-def search_and_click_first_result(driver, company_name: str, random_delay: Callable[[float, float], float]) -> bool:
+def analyze_search_results(driver, search_name: str, interactive: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Analyze search results and return best match (if any)
+    Returns: Tuple of (company_name, company_url) or (None, None) if no match
+    """
+    return pick_best_match(search_name, get_search_results(driver), interactive)
+
+def search_and_click_first_result(driver, company_name: str, random_delay: Callable[[float, float], float], interactive: bool = True) -> bool:
     """Search for a company and click the first result"""
     try:
-        # Wait for the page to be fully loaded
-        random_delay(3, 5)
-        
-        # Try different search box selectors
-        search_selectors = [
-            "input[placeholder*='Search']",
-            "input[type='search']",
-            "input[aria-label*='search']",
-            "input[class*='search']"
-        ]
-        
+        # Try different search box selectors, each waiting for the page to render it
         search_box = None
-        for selector in search_selectors:
+        for selector in selectors.SEARCH_BOX_SELECTORS:
             try:
                 search_box = WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -220,38 +278,33 @@ def search_and_click_first_result(driver, company_name: str, random_delay: Calla
         # Focus and click the search box
         driver.execute_script("arguments[0].focus();", search_box)
         search_box.click()
-        random_delay(0.5, 1)
         
         # Clear any existing text
         search_box.clear()
-        random_delay(0.3, 0.5)
-        
-        # Type the search query with human-like delays
-        for char in company_name:
-            search_box.send_keys(char)
-            random_delay(0.1, 0.3)
-        
-        random_delay(1, 2)
         
-        # Press Enter to search
-        search_box.send_keys(Keys.RETURN)
+        # Type the search query and press Enter in a single command
+        search_url = driver.current_url
+        search_box.send_keys(company_name, Keys.RETURN)
         
-        # Wait for search results
-        print("Waiting for search results...")
-        random_delay(2, 3)
+        # Wait for the results page, so results from an earlier search aren't read
+        logger.debug("Waiting for search results...")
+        try:
+            WebDriverWait(driver, 10).until(EC.url_changes(search_url))
+        except TimeoutException:
+            pass
         
-        # Analyze results and get best match
-        name, url = analyze_search_results(driver, company_name)
+        # Analyze results and get best match (waits for the results to render)
+        name, url = analyze_search_results(driver, company_name, interactive)
         if url:
-            print(f"Navigating to company page...")
+            logger.debug("Navigating to company page...")
             driver.get(url)
             return True
         else:
-            print(f"No suitable match found for '{company_name}'")
+            logger.info("No suitable match found for '%s'", company_name)
             return False
             
     except Exception as e:
-        print(f"Error during search: {e}")
+        logger.error("Error during search: %s", e)
         return False
 
 def get_clean_company_name(driver) -> Optional[str]:
@@ -270,41 +323,40 @@ def get_clean_company_name(driver) -> Optional[str]:
         """, name_element)
         return name.strip()
     except Exception as e:
-        print(f"Error getting clean company name: {e}")
+        logger.error("Error getting clean company name: %s", e)
         return None
 
-def get_funding_amount(driver) -> tuple[Optional[float], Optional[float]]:
-    """Get funding amount in both USD and CNY"""
-    try:
-        funding_elements = driver.find_elements(By.XPATH, 
-            "//span[contains(text(), 'Total Funding Amount')]"
-            "/ancestor::div[contains(@class, 'info')]"
-            "//span[contains(@class, 'field-type-money')]"
-        )
-        
-        if not funding_elements:
-            funding_elements = driver.find_elements(By.XPATH,
-                "//span[contains(@class, 'field-type-money')]"
-                "[contains(text(), '$') or contains(text(), '¥') or contains(text(), 'CN¥')]"
-            )
-        
-        if funding_elements:
-            funding_text = funding_elements[0].get_attribute('title') or funding_elements[0].text
-            funding_text = funding_text.strip()
-            print(f"Found raw funding amount: {funding_text}")
-            
-            amount = parse_currency_amount(funding_text)
-            if amount:
-                if '$' in funding_text:
-                    return amount, amount * CNY_TO_USD_RATE
-                else:  # CNY
-                    return amount / CNY_TO_USD_RATE, amount
-        
-        return None, None
-        
-    except Exception as e:
-        print(f"Error getting funding amount: {e}")
-        return None, None
+# Total funding amount, or the first amount on the page when it isn't labelled
+FUNDING_AMOUNT_XPATHS = [
+    "//span[contains(text(), 'Total Funding Amount')]"
+    "/ancestor::div[contains(@class, 'info')]"
+    "//span[contains(@class, 'field-type-money')]",
+    "//span[contains(@class, 'field-type-money')]"
+    "[contains(text(), '$') or contains(text(), '¥') or contains(text(), 'CN¥')]"
+]
+
+FUNDING_AMOUNT_SCRIPT = """
+    for (const xpath of arguments[0]) {
+        const element = document.evaluate(
+            xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        if (element) {
+            return (element.getAttribute('title') || element.innerText).trim();
+        }
+    }
+    return null;
+"""
+
+def set_funding_amount(company_data: CompanyData, funding_text: Optional[str]):
+    """Set a company's total funding in USD and CNY from a funding amount string"""
+    if not funding_text:
+        return
+    
+    logger.debug("Found raw funding amount: %s", funding_text)
+    # Each currency is kept even if converting to the other one fails
+    company_data.total_funding_usd = parse_currency_amount(funding_text, 'USD')
+    company_data.total_funding_cny = parse_currency_amount(funding_text, 'CNY')
+    logger.debug("Total Funding: USD %s, CNY %s", company_data.total_funding_usd, company_data.total_funding_cny)
 
 def get_funding_info(driver) -> Optional[str]:
     """Get complete funding information text"""
@@ -343,7 +395,7 @@ def get_funding_info(driver) -> Optional[str]:
             return funding_info.strip()
         return None
     except Exception as e:
-        print(f"Error getting funding info: {e}")
+        logger.error("Error getting funding info: %s", e)
         return None
 
 def format_currency(amount: float) -> str:
@@ -360,124 +412,144 @@ def format_currency(amount: float) -> str:
     else:
         return f"{amount:.0f}"
 
+# Lower bounds of the K, M and B formats, with each format's divisor and suffix
+CURRENCY_FORMAT_BINS = [1_000, 1_000_000, 1_000_000_000]
+CURRENCY_FORMAT_DIVISORS = [1, 1_000, 1_000_000, 1_000_000_000]
+CURRENCY_FORMAT_SUFFIXES = ['', 'K', 'M', 'B']
+
+def format_currency_array(amounts) -> List[str]:
+    """Format many amounts at once in shorter format (K, M, B), with '' for missing amounts"""
+    if np is None:
+        return [format_currency(amount) for amount in amounts]
+    
+    # Pick every amount's format in one pass instead of branching per amount
+    values = np.asarray(amounts, dtype=float)
+    bins = np.digitize(values, CURRENCY_FORMAT_BINS)
+    scaled = values / np.take(CURRENCY_FORMAT_DIVISORS, bins)
+    suffixes = np.take(CURRENCY_FORMAT_SUFFIXES, bins)
+    return [
+        '' if math.isnan(value) else f"{value:.1f}{suffix}" if suffix else f"{value:.0f}"
+        for value, suffix in zip(scaled.tolist(), suffixes.tolist())
+    ]
+
+# Fields included in the CSV export, in order
+CSV_FIELDS = [
+    'name',
+    'location',
+    'company_type',
+    'total_funding_usd',
+    'total_funding_cny',
+    'employee_count',
+    'year_founded',
+    'website'
+]
+CURRENCY_FIELDS = {'total_funding_usd', 'total_funding_cny'}
+
+def get_csv_columns(companies: List[CompanyData]) -> List[List]:
+    """Get the columns of the CSV export, formatting each currency column in one pass"""
+    columns = []
+    for field in CSV_FIELDS:
+        values = [getattr(company, field) for company in companies]
+        if field in CURRENCY_FIELDS:
+            columns.append(format_currency_array(values))
+        else:
+            columns.append(['' if value is None else value for value in values])
+    return columns
+
+def get_csv_headers() -> List[str]:
+    """Get the column headers of the CSV export"""
+    return [field.replace('_', ' ').title() for field in CSV_FIELDS]
+
 def save_companies_to_csv(companies: List[CompanyData], filename: str = "companies.csv"):
-    """Save company data to CSV file"""
+    """Save company data to CSV file, letting pandas write the rows when it's installed"""
     try:
-        # Define which fields to include and their order
-        fields = [
-            'name',
-            'location',
-            'company_type',
-            'total_funding_usd',
-            'total_funding_cny',
-            'employee_count',
-            'year_founded',
-            'website'
-        ]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        # Amounts are stored as raw floats and only formatted here, a column at a time
+        columns = get_csv_columns(companies)
+        
+        if pd is not None:
+            # Object columns keep ints as ints
+            frame = pd.DataFrame(dict(zip(CSV_FIELDS, columns)), columns=CSV_FIELDS, dtype=object)
+            # Match csv.writer's line endings so the export doesn't depend on pandas being installed
+            frame.to_csv(filename, index=False, header=get_csv_headers(), encoding='utf-8', lineterminator='\r\n')
+            logger.info("Successfully saved data to %s", filename)
+            return
+        
+        with open(filename, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
             # Write headers
-            headers = [field.replace('_', ' ').title() for field in fields]
-            writer.writerow(headers)
+            writer.writerow(get_csv_headers())
             
-            # Write data
-            for company in companies:
-                row = []
-                for field in fields:
-                    value = getattr(company, field)
-                    if field in ['total_funding_usd', 'total_funding_cny'] and value is not None:
-                        value = format_currency(value)
-                    row.append(value if value is not None else '')
-                writer.writerow(row)
+            # Stream rows straight into the buffered file
+            writer.writerows(zip(*columns))
                 
-        print(f"Successfully saved data to {filename}")
+        logger.info("Successfully saved data to %s", filename)
     except Exception as e:
-        print(f"Error saving to CSV: {e}")
+        logger.error("Error saving to CSV: %s", e)
 
 def get_field_by_svg(driver, svg_path: str) -> Optional[str]:
     """Get field value by matching SVG path in the element"""
     try:
-        # First, find all SVG paths on the page
-        paths = driver.find_elements(By.TAG_NAME, "path")
-        
-        matching_path = None
-        for path in paths:
-            try:
-                path_d = path.get_attribute('d')
-                if path_d and path_d.startswith(svg_path[:30]):  # Match first 30 chars
-                    matching_path = path
-                    break
-            except:
-                continue
-        
-        if not matching_path:
-            print("No matching SVG path found")
+        # Find the path by prefix and jump to its row's non-empty spans in one query
+        # The icon's path is in the SVG namespace, which an unprefixed name test doesn't match
+        spans = driver.find_elements(By.XPATH,
+            f"//li//*[local-name()='path'][starts-with(@d, '{svg_path[:30]}')]/ancestor::li[1]"  # Match first 30 chars
+            "//span[normalize-space(.)][not(starts-with(normalize-space(.), 'svg'))]"
+        )
+        if not spans:
+            logger.debug("No matching SVG path found")
             return None
-            
-        # Find the parent li element
-        current = matching_path
-        max_iterations = 10  # Prevent infinite loop
-        iterations = 0
-        
-        while current and iterations < max_iterations:
-            if current.tag_name == 'li':
-                # Found the li element, now get the text content
-                spans = current.find_elements(By.TAG_NAME, "span")
-                for span in spans:
-                    try:
-                        text = span.text.strip()
-                        if text and not text.startswith('svg'):
-                            return text
-                    except:
-                        continue
-                break
-            current = current.find_element(By.XPATH, '..')
-            iterations += 1
         
+        # Hidden spans have source text but no rendered text, so skip to the first visible one
+        for span in spans:
+            text = span.text.strip()
+            if text:
+                return text
         return None
     except Exception as e:
-        print(f"Error finding element by SVG: {e}")
+        logger.debug("Error finding element by SVG: %s", e)
         return None
 
+def get_label_xpath(label_text: str) -> str:
+    """Build the XPath of a field's value from its label text"""
+    # Split the label text into words
+    words = label_text.split()
+    first_word, last_word = words[0], words[-1]
+    
+    # Build XPath to find li element containing both parts of the label
+    xpath_base = f"//li[.//span[contains(text(), '{first_word}')] and .//span[contains(text(), '{last_word}')]]"
+    
+    # Different field types use different formatter classes
+    field_type_mapping = {
+        'Founded Date': 'field-type-date_precision',
+        'Stock Symbol': 'link-formatter',
+        'Legal Name': 'blob-formatter',
+        'Operating Status': 'field-type-enum'
+    }
+    
+    field_type = field_type_mapping.get(label_text, 'field-formatter')
+    
+    # Find the value using the appropriate class
+    if label_text == 'Legal Name':
+        # Legal Name is in a blob-formatter span
+        return f"{xpath_base}//blob-formatter//span"
+    elif label_text == 'Operating Status':
+        # Operating Status is in a field-type-enum span
+        return f"{xpath_base}//span[contains(@class, 'field-type-enum')]"
+    elif label_text == 'Founded Date':
+        # Founded Date is in a field-type-date_precision span
+        return f"{xpath_base}//span[contains(@class, 'field-type-date_precision')]"
+    elif label_text == 'Stock Symbol':
+        # Stock Symbol is in a link-formatter anchor tag
+        return f"{xpath_base}//link-formatter//a"
+    else:
+        # Default to field-formatter
+        return f"{xpath_base}//*[contains(@class, '{field_type}')]"
+
 def get_field_by_label(driver, label_text: str) -> Optional[str]:
     """Get field value by matching the label text"""
     try:
-        # Split the label text into words
-        words = label_text.split()
-        first_word, last_word = words[0], words[-1]
-        
-        # Build XPath to find li element containing both parts of the label
-        xpath_base = f"//li[.//span[contains(text(), '{first_word}')] and .//span[contains(text(), '{last_word}')]]"
-        
-        # Different field types use different formatter classes
-        field_type_mapping = {
-            'Founded Date': 'field-type-date_precision',
-            'Stock Symbol': 'link-formatter',
-            'Legal Name': 'blob-formatter',
-            'Operating Status': 'field-type-enum'
-        }
-        
-        field_type = field_type_mapping.get(label_text, 'field-formatter')
-        
-        # Try to find the value using the appropriate class
-        if label_text == 'Legal Name':
-            # Legal Name is in a blob-formatter span
-            xpath = f"{xpath_base}//blob-formatter//span"
-        elif label_text == 'Operating Status':
-            # Operating Status is in a field-type-enum span
-            xpath = f"{xpath_base}//span[contains(@class, 'field-type-enum')]"
-        elif label_text == 'Founded Date':
-            # Founded Date is in a field-type-date_precision span
-            xpath = f"{xpath_base}//span[contains(@class, 'field-type-date_precision')]"
-        elif label_text == 'Stock Symbol':
-            # Stock Symbol is in a link-formatter anchor tag
-            xpath = f"{xpath_base}//link-formatter//a"
-        else:
-            # Default to field-formatter
-            xpath = f"{xpath_base}//*[contains(@class, '{field_type}')]"
-        
+        xpath = _LABEL_XPATHS.get(label_text) or get_label_xpath(label_text)
         element = driver.find_element(By.XPATH, xpath)
         # For stock symbol, get the title attribute which contains just the symbol
         if label_text == 'Stock Symbol':
@@ -487,21 +559,24 @@ def get_field_by_label(driver, label_text: str) -> Optional[str]:
         return value
         
     except Exception as e:
-        print(f"Error finding element by label '{label_text}': {e}")
+        logger.debug("Error finding element by label '%s': %s", label_text, e)
         return None
 
+def get_numeric_xpath(label_text: str) -> str:
+    """Build the XPath of a count from the label text of its link"""
+    return f"//a[.//span[text()='{label_text}']]//span[contains(@class, 'field-type-integer')]"
+
 def get_numeric_field_by_label(driver, label_text: str) -> Optional[int]:
     """Get numeric value by matching the label text in links"""
     try:
         # Find the link containing the label text
-        xpath = f"//a[.//span[text()='{label_text}']]//span[contains(@class, 'field-type-integer')]"
-        element = driver.find_element(By.XPATH, xpath)
+        element = driver.find_element(By.XPATH, get_numeric_xpath(label_text))
         value = element.get_attribute('title') or element.text.strip()
         if value and value.isdigit():
             return int(value)
         return None
     except Exception as e:
-        print(f"Error finding {label_text} count: {e}")
+        logger.debug("Error finding %s count: %s", label_text, e)
         return None
 
 # SVG path constants
@@ -514,141 +589,280 @@ SVG_PATHS = {
     'funding_type': "M12.52,10.53c-3-.78-4-1.6-4-2.86,0-1.46,1.35-2.47,3.6-2.47S15.37,6.33,15.45,8H18.4a5.31,5.31,0,0,0-4.28-5.08V0h-4V2.88c-2.59.56-4.67,2.24-4.67,4.81,0,3.08,2.55,4.62,6.27,5.51,3.33.8,4,2,4,3.21,0,.92-.65,2.39-3.6,2.39-2.75,0-3.83-1.23-4-2.8H5.21c.16,2.92,2.35,4.56,4.91,5.11V24h4V21.13c2.6-.49,4.67-2,4.67-4.73C18.79,12.61,15.55,11.32,12.52,10.53Z"
 }
 
-def get_company_description(driver) -> Optional[str]:
-    """Get company description from the description-card element"""
-    try:
-        # Try to find the description using the specific class
-        description = driver.find_element(By.CSS_SELECTOR, "description-card .description")
-        return description.text.strip()
-    except NoSuchElementException:
-        try:
-            # Fallback: try to find any description element
-            description = driver.find_element(By.CSS_SELECTOR, ".description")
-            return description.text.strip()
-        except NoSuchElementException:
-            print("Could not find company description")
-            return None
-    except Exception as e:
-        print(f"Error getting company description: {e}")
-        return None
+# Company fields located by the SVG icon in their row
+SVG_FIELDS = {
+    'location': SVG_PATHS['location'],
+    'employee_count': SVG_PATHS['employees'],
+    'company_type': SVG_PATHS['company_type'],
+    'website': SVG_PATHS['website'],
+    'ranking': SVG_PATHS['ranking'],
+    'last_funding_type': SVG_PATHS['funding_type']
+}
 
-def scrape_company_data(driver, random_delay: Callable[[float, float], float]) -> Optional[CompanyData]:
-    """Scrape all company data from the current page"""
-    try:
-        random_delay(3, 5)
-        print("Scraping company data...")
-        
-        name = get_clean_company_name(driver)
-        if not name:
-            print("Could not find company name")
-            return None
-            
-        company_data = CompanyData(name=name)
-        print(f"\nCompany: {name}")
-        
-        # Get company description
-        description = get_company_description(driver)
-        if description:
-            company_data.about = description
-            print(f"Description: {description[:100]}...")
-        else:
-            print("Description: Not found")
-        
-        # Get data using SVG paths
-        field_mapping = {
-            'location': SVG_PATHS['location'],
-            'employee_count': SVG_PATHS['employees'],
-            'company_type': SVG_PATHS['company_type'],
-            'website': SVG_PATHS['website'],
-            'ranking': SVG_PATHS['ranking'],
-            'last_funding_type': SVG_PATHS['funding_type']
+# Company count fields located by their link label
+NUMERIC_FIELDS = {
+    'acquisitions_count': 'Acquisitions',
+    'investments_count': 'Investments',
+    'exits_count': 'Exits'
+}
+
+# Company fields located by their row label
+LABEL_FIELDS = {
+    'founded_date': 'Founded Date',
+    'stock_symbol': 'Stock Symbol',
+    'legal_name': 'Legal Name',
+    'operating_status': 'Operating Status'
+}
+# Value XPaths of the known labels, built once
+_LABEL_XPATHS = {label: get_label_xpath(label) for label in LABEL_FIELDS.values()}
+
+# Fields whose value is only taken from the title attribute
+TITLE_ONLY_FIELDS = ['stock_symbol']
+
+# Reads every profile field in one page evaluation, mirroring the per-field helpers above
+PROFILE_FIELDS_SCRIPT = """
+    const config = arguments[0];
+    const values = {};
+    const textOf = element => element ? element.innerText.trim() : null;
+    const evaluate = xpath => document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    
+    // Company name without extra elements
+    const heading = document.querySelector('h1.profile-name');
+    values.name = heading ? Array.from(heading.childNodes)
+        .filter(node => node.nodeType === 3)
+        .map(node => node.textContent)
+        .join('').trim() : null;
+    
+    // Fields with plain selectors, tried in order
+    for (const [field, fieldSelectors] of Object.entries(config.selectors)) {
+        values[field] = null;
+        for (const selector of fieldSelectors) {
+            const element = document.querySelector(selector);
+            if (element) {
+                values[field] = textOf(element);
+                break;
+            }
         }
-        
-        for field, svg_path in field_mapping.items():
-            value = get_field_by_svg(driver, svg_path)
-            if value:
-                if field == 'website':
-                    # For website, we need to find the actual href
-                    try:
-                        element = driver.find_element(By.XPATH, f"//li[.//path[@d='{svg_path}']]//a")
-                        value = element.get_attribute('href')
-                    except:
-                        pass
-                elif field == 'ranking' and value.isdigit():
-                    value = int(value)
-                
-                setattr(company_data, field, value)
-                print(f"{field.replace('_', ' ').title()}: {value}")
-            else:
-                print(f"{field.replace('_', ' ').title()}: Not found")
-        
-        # Get numeric fields
-        numeric_fields = {
-            'acquisitions_count': 'Acquisitions',
-            'investments_count': 'Investments',
-            'exits_count': 'Exits'
+    }
+    
+    // Fields in the row marked by an SVG icon
+    for (const [field, prefix] of Object.entries(config.svgPrefixes)) {
+        values[field] = null;
+        const path = document.querySelector(`li path[d^="${prefix}"]`);
+        const row = path && path.closest('li');
+        if (!row) continue;
+        for (const span of row.querySelectorAll('span')) {
+            const text = textOf(span);
+            if (text && !text.startsWith('svg')) {
+                values[field] = text;
+                break;
+            }
         }
-        
-        for field, label in numeric_fields.items():
-            value = get_numeric_field_by_label(driver, label)
-            if value is not None:
-                setattr(company_data, field, value)
-                print(f"{field.replace('_', ' ').title()}: {value}")
-            else:
-                print(f"{field.replace('_', ' ').title()}: Not found")
-        
-        # Get fields by label text
-        label_fields = {
-            'founded_date': 'Founded Date',
-            'stock_symbol': 'Stock Symbol',
-            'legal_name': 'Legal Name',
-            'operating_status': 'Operating Status'
+        // Links are read from their href rather than their text
+        const link = row.querySelector('a');
+        if (field === 'website' && values[field] && link) {
+            values[field] = link.href;
+        }
+    }
+    
+    // Fields found by XPath, preferring the title attribute
+    for (const [field, xpath] of Object.entries(config.xpaths)) {
+        const element = evaluate(xpath);
+        if (!element) {
+            values[field] = null;
+        } else if (config.titleOnly.includes(field)) {
+            values[field] = element.getAttribute('title');
+        } else {
+            values[field] = element.getAttribute('title') || textOf(element);
         }
+    }
+    
+    // Total funding amount, from the first XPath that finds one
+    values.total_funding = null;
+    for (const xpath of config.fundingXPaths) {
+        const element = evaluate(xpath);
+        if (element) {
+            values.total_funding = element.getAttribute('title') || textOf(element);
+            break;
+        }
+    }
+    return values;
+"""
+
+def get_profile_fields(driver) -> dict:
+    """Read all profile fields with a single script call"""
+    xpaths = {field: get_numeric_xpath(label) for field, label in NUMERIC_FIELDS.items()}
+    xpaths.update({field: _LABEL_XPATHS[label] for field, label in LABEL_FIELDS.items()})
+    return driver.execute_script(PROFILE_FIELDS_SCRIPT, {
+        'selectors': selectors.FIELD_SELECTORS,
+        'svgPrefixes': {field: svg_path[:30] for field, svg_path in SVG_FIELDS.items()},
+        'xpaths': xpaths,
+        'titleOnly': TITLE_ONLY_FIELDS,
+        'fundingXPaths': FUNDING_AMOUNT_XPATHS
+    })
+
+def read_profile_fields(driver) -> dict:
+    """Read all profile fields one WebDriver command at a time"""
+    values = {'name': get_clean_company_name(driver)}
+    
+    for field, field_selectors in selectors.FIELD_SELECTORS.items():
+        values[field] = None
+        for selector in field_selectors:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                values[field] = elements[0].text.strip()
+                break
+    
+    for field, svg_path in SVG_FIELDS.items():
+        value = get_field_by_svg(driver, svg_path)
+        if value and field == 'website':
+            # For website, we need to find the actual href
+            try:
+                element = driver.find_element(By.XPATH, f"//li[.//path[@d='{svg_path}']]//a")
+                value = element.get_attribute('href')
+            except NoSuchElementException:
+                pass
+        values[field] = value
+    
+    for field, label in NUMERIC_FIELDS.items():
+        values[field] = get_numeric_field_by_label(driver, label)
+    
+    for field, label in LABEL_FIELDS.items():
+        values[field] = get_field_by_label(driver, label)
+    
+    values['total_funding'] = driver.execute_script(FUNDING_AMOUNT_SCRIPT, FUNDING_AMOUNT_XPATHS)
+    
+    return values
+
+def build_company_data(values: dict) -> Optional[CompanyData]:
+    """Build company data from raw profile field values, or None without a company name"""
+    name = values.get('name')
+    if not name:
+        logger.warning("Could not find company name")
+        return None
         
-        for field, label in label_fields.items():
-            value = get_field_by_label(driver, label)
-            if value:
-                if field == 'founded_date':
-                    try:
-                        # Extract year from the date string
-                        year = int(value.split(',')[-1].strip())
-                        company_data.year_founded = year
-                        print(f"Founded Date: {value} (Year: {year})")
-                    except:
-                        print(f"\nCouldn't parse founded date: {value}")
-                else:
-                    setattr(company_data, field, value)
-                    print(f"{field.replace('_', ' ').title()}: {value}")
+    company_data = CompanyData(name=name)
+    logger.info("Company: %s", name)
+    
+    # Company description
+    description = values.get('about')
+    if description:
+        company_data.about = description
+        logger.debug("Description: %s...", description[:100])
+    else:
+        logger.debug("Description: Not found")
+    
+    # Fields located by SVG paths
+    for field in SVG_FIELDS:
+        value = values.get(field)
+        if value:
+            if field == 'ranking' and value.isdigit():
+                value = int(value)
+            
+            setattr(company_data, field, value)
+            logger.debug("%s: %s", field.replace('_', ' ').title(), value)
+        else:
+            logger.debug("%s: Not found", field.replace('_', ' ').title())
+    
+    # Numeric fields
+    for field in NUMERIC_FIELDS:
+        value = values.get(field)
+        if value is not None and str(value).isdigit():
+            value = int(value)
+            setattr(company_data, field, value)
+            logger.debug("%s: %s", field.replace('_', ' ').title(), value)
+        else:
+            logger.debug("%s: Not found", field.replace('_', ' ').title())
+    
+    # Fields located by label text
+    for field in LABEL_FIELDS:
+        value = values.get(field)
+        if value:
+            if field == 'founded_date':
+                try:
+                    # Extract year from the date string
+                    year = int(value.split(',')[-1].strip())
+                    company_data.year_founded = year
+                    logger.debug("Founded Date: %s (Year: %s)", value, year)
+                except ValueError:
+                    logger.warning("Couldn't parse founded date: %s", value)
             else:
-                print(f"{field.replace('_', ' ').title()}: Not found")
+                setattr(company_data, field, value)
+                logger.debug("%s: %s", field.replace('_', ' ').title(), value)
+        else:
+            logger.debug("%s: Not found", field.replace('_', ' ').title())
+    
+    # Funding amounts
+    set_funding_amount(company_data, values.get('total_funding'))
+    
+    return company_data
+
+def scrape_funding_info(driver, fetch_funding_info: Optional[Callable[[str], Optional[str]]] = None) -> Optional[str]:
+    """
+    Get funding information for the company on the current page
+    The financials tab is only loaded in the browser when the summary isn't on the profile and can't be fetched
+    """
+    # The summary is sometimes shown on the profile itself
+    funding_info = get_funding_info(driver)
+    if funding_info:
+        return funding_info
+    
+    current_url = driver.current_url
+    if fetch_funding_info:
+        funding_info = fetch_funding_info(current_url)
+        if funding_info:
+            return funding_info
+    
+    # Get funding info from financials tab
+    driver.get(current_url + "/company_financials")
+    try:
+        # Funding summary, or the tab's content cards when there is none
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "markup-block, row-card"))
+        )
+    except TimeoutException:
+        pass
+    
+    funding_info = get_funding_info(driver)
+    
+    # Return to main page
+    driver.get(current_url)
+    return funding_info
+
+def scrape_company_data(driver, fetch_funding_info: Optional[Callable[[str], Optional[str]]] = None) -> Optional[CompanyData]:
+    """
+    Scrape all company data from the current page
+    fetch_funding_info can get funding information from a company URL without the browser, returning None when it can't
+    """
+    try:
+        logger.info("Scraping company data...")
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1.profile-name"))
+            )
+        except TimeoutException:
+            pass
         
-        # Get funding amounts 
-        # usd_amount, cny_amount = get_funding_amount(driver)
-        # if usd_amount and cny_amount:
-        #     company_data.total_funding_usd = usd_amount
-        #     company_data.total_funding_cny = cny_amount
-        #     print(f"\nTotal Funding:")
-        #     print(f"USD: ${usd_amount:,.2f}")
-        #     print(f"CNY: ¥{cny_amount:,.2f}")
+        # Read every field in one round-trip, falling back to field-by-field lookups
+        try:
+            values = get_profile_fields(driver)
+        except WebDriverException as e:
+            logger.warning("Couldn't read profile fields in one pass, reading them one by one: %s", e)
+            values = read_profile_fields(driver)
         
-        # Get funding info from financials tab
-        current_url = driver.current_url
-        financials_url = current_url + "/company_financials"
-        driver.get(financials_url)
-        random_delay(3, 5)
+        company_data = build_company_data(values)
+        if not company_data:
+            return None
         
-        funding_info = get_funding_info(driver)
+        funding_info = scrape_funding_info(driver, fetch_funding_info)
         if funding_info:
             company_data.funding_info = funding_info
-            print(f"Funding Information: {funding_info}")
-        
-        # Return to main page
-        driver.get(current_url)
-        random_delay(2, 3)
+            logger.debug("Funding Information: %s", funding_info)
         
-        print("\n" + "="*50 + "\n")
         return company_data
         
     except Exception as e:
-        print(f"Error scraping company data: {e}")
+        logger.error("Error scraping company data: %s", e)
         return None 
\ No newline at end of file